@@ -395,6 +395,34 @@ class TestCLIInterface(unittest.TestCase):
         self.assertIn('PLANT', output)
         self.assertIn('suggest', output.lower())
     
+    def test_display_default_guess_when_no_suggestions(self):
+        """
+        Test Case 4.6.2: System falls back to the default first guess when nothing is scored
+        
+        Requirement 4.6: Display suggested next guess after all constraints are applied
+        
+        Given: No scored words are available
+        When: display_default_guess or display_suggested_guess is called without arguments
+        Then: The default first guess is displayed
+        """
+        solver = WordleSolver()
+        
+        import io
+        from contextlib import redirect_stdout
+        
+        f = io.StringIO()
+        with redirect_stdout(f):
+            solver.display_default_guess()
+        
+        output = f.getvalue()
+        self.assertIn(solver.get_default_first_guess(), output)
+        self.assertIn('suggest', output.lower())
+        
+        f = io.StringIO()
+        with redirect_stdout(f):
+            solver.display_suggested_guess()
+        self.assertEqual(f.getvalue(), output)
+    
     @patch('builtins.input')
     def test_interactive_loop_continues_until_solved_or_exit(self, mock_input):
         """
@@ -442,6 +470,48 @@ class TestCLIInterface(unittest.TestCase):
         # Test invalid yellow letters format  
         result = solver.validate_yellow_letters('A..')  # Wrong length
         self.assertFalse(result[0])
+    
+    def test_validate_grey_letters_format(self):
+        """
+        Test Case 5.4.2: System validates grey letters input format
+        
+        Requirement 5.4: Handle invalid input gracefully with appropriate error messages
+        
+        Given: User provides grey letters input
+        When: validate_grey_letters is called
+        Then: Space-separated single letters are accepted; anything else returns an error message
+        """
+        solver = WordleSolver()
+        
+        # Valid input: empty, single letter, space-separated letters with extra spacing
+        for grey_input in ['', 'X', 'E R T', ' e  r ']:
+            self.assertEqual(solver.validate_grey_letters(grey_input), (True, ""))
+        
+        # Invalid input: multi-letter tokens, punctuation, digits
+        for grey_input in ['ER', 'E,R', 'E 1']:
+            is_valid, error_msg = solver.validate_grey_letters(grey_input)
+            self.assertFalse(is_valid)
+            self.assertIn('error', error_msg.lower())
+    
+    def test_validation_accepts_any_alphabetic_letter(self):
+        """
+        Test Case 5.4.3: Every validator treats letters the same way, including non-ASCII ones
+        
+        Requirement 5.4: Handle invalid input gracefully with appropriate error messages
+        
+        Given: Input containing a non-ASCII letter such as 'É'
+        When: The guess, green, yellow and grey validators and process_feedback check it
+        Then: The letter is accepted everywhere, as str.isalpha() accepts it
+        """
+        solver = WordleSolver()
+        
+        self.assertEqual(solver.validate_guess('ÉCLAT'), (True, ""))
+        self.assertEqual(solver.validate_green_letters('É....'), (True, ""))
+        self.assertEqual(solver.validate_yellow_letters('.é...'), (True, ""))
+        self.assertEqual(solver.validate_grey_letters('é X'), (True, ""))
+        
+        result = solver.process_feedback('saint', 'É....', '.é...', ['é'])
+        self.assertIn('candidates', result)
 
 
 class TestGuessWordFilterGeneration(unittest.TestCase):
@@ -615,6 +685,90 @@ class TestGuessWordFilterGeneration(unittest.TestCase):
         # Verify no overlap
         self.assertEqual(unique_words & repeated_words, set())
     
+    def test_filtered_candidates_match_plain_set_queries(self):
+        """
+        Test Case 3.2.2: Candidate queries agree whether candidates came from filtering or not
+        
+        Requirement 3.2: Return candidate sets split into two sections - unique letters and repeated letters
+        Requirement 3.4: Prioritize words that have the most vowels
+        
+        Given: Candidates produced by filter_candidates (which keeps a bitmap of them)
+        When: The same words are assigned directly as a plain set
+        Then: Uniqueness split, vowel prioritization and suggestions are identical
+        """
+        solver = WordleSolver()
+        # A lightly constrained first round keeps most words, which is when the bitmap is used
+        solver.grey_constraints = {'Q'}
+        solver.filter_candidates()
+        
+        from_filter = (
+            solver.split_candidates_by_letter_uniqueness(),
+            solver.get_words_with_most_vowels(),
+            solver.get_suggested_next_guess(),
+        )
+        
+        solver.candidate_words = set(solver.candidate_words)
+        from_set = (
+            solver.split_candidates_by_letter_uniqueness(),
+            solver.get_words_with_most_vowels(),
+            solver.get_suggested_next_guess(),
+        )
+        
+        self.assertTrue(solver.candidate_words)
+        self.assertEqual(from_filter, from_set)
+    
+    def test_in_place_candidate_changes_are_reflected(self):
+        """
+        Test Case 3.2.3: Candidate queries see changes made to the candidate set in place
+        
+        Requirement 3.4: Prioritize words that have the most vowels
+        Requirement 3.5: Compute word score for each word - lower score is better
+        
+        Given: Candidates produced by filter_candidates (which keeps a bitmap of them)
+        When: A word is removed from candidate_words in place
+        Then: Vowel prioritization and suggestions no longer include it
+        """
+        solver = WordleSolver()
+        solver.grey_constraints = {'Q'}
+        solver.filter_candidates()
+        removed = min(solver.get_words_with_most_vowels())
+        
+        solver.candidate_words.discard(removed)
+        
+        self.assertNotIn(removed, solver.get_words_with_most_vowels())
+        self.assertNotIn(removed, [word for word, score in solver.get_suggested_next_guess()])
+    
+    def test_in_place_candidate_changes_are_displayed(self):
+        """
+        Test Case 3.2.4: The uniqueness split and display follow in-place candidate changes
+        
+        Requirement 3.2: Display candidates split into unique letters and repeated letters sections
+        Requirement 4.5: Display filtered candidate words after each constraint application
+        
+        Given: Candidates produced by filter_candidates (which keeps them in sorted order)
+        When: candidate_words is narrowed or cleared in place
+        Then: The split and the display show only the remaining words
+        """
+        solver = WordleSolver()
+        solver.filter_candidates()
+        solver.candidate_words.intersection_update({'saint', 'slant'})
+        
+        self.assertEqual(solver.split_candidates_by_letter_uniqueness(), ({'saint', 'slant'}, set()))
+        
+        import io
+        from contextlib import redirect_stdout
+        
+        f = io.StringIO()
+        with redirect_stdout(f):
+            solver.display_candidates()
+        output = f.getvalue()
+        self.assertIn("Found 2 candidate word(s)", output)
+        self.assertIn("  SAINT SLANT\n", output)
+        self.assertNotIn("Section 2", output)
+        
+        solver.candidate_words.clear()
+        self.assertEqual(solver.split_candidates_by_letter_uniqueness(), (set(), set()))
+    
     def test_compute_word_score_based_on_positional_frequency(self):
         """
         Test Case 3.5.1: System computes word score based on positional frequency line numbers
@@ -858,6 +1012,31 @@ class TestGuessWordFilterGeneration(unittest.TestCase):
             for word in solver.candidate_words:
                 if word.startswith('plan'):
                     self.assertNotEqual(word[4].lower(), 'e')  # 5th letter (0-indexed: 4) should not be 'e'
+    
+    def test_expansion_keeps_best_scored_words(self):
+        """
+        Test Case 3.3.2: Expansion with several unfixed positions returns the best-scored words
+        
+        Requirement 3.3: Iteratively expand top-N letter set incrementally when candidate set becomes empty
+        Requirement 3.5: Compute word score - lower score is better
+        
+        Given: Green constraints leave several positions unfixed and many words match
+        When: expand_candidates_when_empty is called
+        Then: The MAX_EXPANDED_CANDIDATES lowest-scoring matches are returned, not the first found
+        """
+        solver = WordleSolver()
+        solver.green_constraints = {1: 'S', 2: 'T'}
+        solver.candidate_words = set()
+        solver.expand_candidates_when_empty()
+        
+        top_letters = solver.extract_top_letters(3, n=solver.MAX_LETTERS_PER_POSITION_FOR_EXPANSION)
+        matches = {
+            word for word in solver.valid_words
+            if len(word) == solver.WORD_LENGTH and word.startswith('st') and word[2] in top_letters
+        }
+        self.assertGreater(len(matches), solver.MAX_EXPANDED_CANDIDATES)
+        expected = solver.compute_word_scores(matches)[:solver.MAX_EXPANDED_CANDIDATES]
+        self.assertEqual(solver.candidate_words, {word for word, score in expected})
 
 
 class TestRegexFiltering(unittest.TestCase):
@@ -891,6 +1070,26 @@ class TestRegexFiltering(unittest.TestCase):
         for word in solver.candidate_words:
             self.assertNotIn('e', word.lower())
             self.assertNotIn('r', word.lower())
+    
+    def test_word_list_changes_go_through_assignment(self):
+        """
+        Test Case 5.1.2: The filtering index always reflects the current word list
+        
+        Requirement 5.1: Use regex-based filtering for efficient constraint application
+        
+        Given: A solver whose word list has been indexed
+        When: The word list is changed in place, or a new word list is assigned
+        Then: In-place changes are rejected, and filtering uses the newly assigned words
+        """
+        solver = WordleSolver()
+        solver.valid_words = {'saint', 'slant'}
+        with self.assertRaises(AttributeError):
+            solver.valid_words.discard('saint')
+        
+        solver.valid_words = solver.valid_words - {'saint'}
+        solver.green_constraints = {1: 'S', 2: 'A', 3: 'I', 4: 'N', 5: 'T'}
+        solver.filter_candidates()
+        self.assertNotIn('saint', solver.candidate_words)
 
 
 if __name__ == '__main__':
@@ -906,6 +1105,7 @@ throughout the entire puzzle-solving process.
 import unittest
 import tempfile
 import os
+from unittest.mock import patch
 from wordle_solver import WordleSolver
 
 
@@ -1003,6 +1203,80 @@ class TestConstraintAccumulation(unittest.TestCase):
             if 'i' in candidate:
                 self.assertNotEqual(candidate[2], 'i',
                                   f"{candidate} should not have I in position 3")
+    
+    def test_repeated_feedback_state_is_memoized(self):
+        """
+        Test that feedback producing an already-seen constraint state is served from the cache
+        
+        Scenario:
+        - Two solvers receive the same round 1 feedback
+        - The second call on a solver with the same merged constraints must not refilter
+        
+        Expected: Identical results, no second filtering or scoring call, and returned
+        lists are copies that cannot corrupt the cache
+        """
+        words_file = os.path.join(self.tmpdir, 'wordle-words.txt')
+        solver = WordleSolver(frequency_dir=self.tmpdir, words_file=words_file)
+        
+        result1 = solver.process_feedback("saint", ".....", "..i..", ["s", "a", "n", "t"])
+        result1["candidates"].append("bogus")
+        result1["suggestions"][0]["score"] = -1
+        
+        # Same feedback again leaves the merged constraints unchanged
+        with patch.object(solver, '_filter_candidates') as mock_filter, \
+                patch.object(solver, 'get_suggested_next_guess') as mock_suggest:
+            result2 = solver.process_feedback("saint", ".....", "..i..", ["s", "a", "n", "t"])
+            mock_filter.assert_not_called()
+            mock_suggest.assert_not_called()
+        
+        fresh = WordleSolver(frequency_dir=self.tmpdir, words_file=words_file)
+        expected = fresh.process_feedback("saint", ".....", "..i..", ["s", "a", "n", "t"])
+        self.assertEqual(result2, expected)
+        self.assertEqual(solver.candidate_words, set(expected["candidates"]))
+    
+    def test_incremental_filtering_matches_full_filtering(self):
+        """
+        Test that refiltering from the previous round's result matches a full filter
+        
+        Scenario:
+        - Round 1 constraints are applied, then round 2 adds more constraints
+        - Rounds 3-6 remove a grey letter, change a grey letter, remove a green letter
+          and drop a yellow position, so the previous result cannot be reused
+        - Round 7 starts over with S excluded from position 1, and round 8 makes S green
+          at position 1 (an earlier yellow exclusion at a newly green position)
+        
+        Expected: After every round the candidates equal those of a solver that
+        filters the full word list from scratch
+        """
+        words_file = os.path.join(self.tmpdir, 'wordle-words.txt')
+        solver = WordleSolver(frequency_dir=self.tmpdir, words_file=words_file)
+        
+        rounds = [
+            ({}, {'I': {3}}, {'S', 'A', 'N', 'T'}),
+            ({1: 'P'}, {'I': {3}, 'E': {1}}, {'S', 'A', 'N', 'T', 'X'}),
+            ({1: 'P'}, {'I': {3}, 'E': {1}}, {'S', 'A', 'N'}),
+            ({1: 'P'}, {'I': {3}, 'E': {1}}, {'S', 'A', 'O'}),
+            ({}, {'I': {2, 3}, 'E': {1}}, {'S', 'A', 'O'}),
+            ({}, {'I': {3}, 'E': {1}}, {'S', 'A', 'O'}),
+            ({}, {'S': {1}}, set()),
+            ({1: 'S'}, {'S': {1}}, set()),
+        ]
+        for green, yellow, grey in rounds:
+            solver.green_constraints = dict(green)
+            solver.yellow_constraints = {letter: set(positions) for letter, positions in yellow.items()}
+            solver.grey_constraints = set(grey)
+            solver.filter_candidates()
+            
+            fresh = WordleSolver(frequency_dir=self.tmpdir, words_file=words_file)
+            fresh.green_constraints = dict(green)
+            fresh.yellow_constraints = {letter: set(positions) for letter, positions in yellow.items()}
+            fresh.grey_constraints = set(grey)
+            fresh.filter_candidates()
+            
+            self.assertEqual(solver.candidate_words, fresh.candidate_words)
+        
+        # The last round keeps the words starting with S
+        self.assertEqual(solver.candidate_words, {'saint', 'slice'})
 
 
 if __name__ == '__main__':
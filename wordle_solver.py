@@ -14,9 +14,27 @@ The solver requires:
 
 See README.md for detailed setup and usage instructions.
 """
+import heapq
 import os
 import re
-from typing import Dict, Set, List, Tuple, Optional, Callable, Any
+import string
+import sys
+from collections import OrderedDict
+from itertools import compress, islice, repeat
+from operator import add, itemgetter
+from typing import Dict, Set, FrozenSet, List, Tuple, Optional, Callable, Any, Iterable, Collection
+
+
+class _PenaltyRanks(dict):
+    """Letter -> line number table that returns a penalty for letters it does not contain"""
+    __slots__ = ('penalty',)
+    
+    def __init__(self, ranks: Dict[str, int], penalty: int):
+        super().__init__(ranks)
+        self.penalty = penalty
+    
+    def __missing__(self, letter: str) -> int:
+        return self.penalty
 
 
 class WordleSolver:
@@ -30,8 +48,18 @@ class WordleSolver:
     WORDS_PER_LINE = 10
     MAX_LETTERS_IN_ALPHABET = 26
     VOWELS = set('aeiou')
+    _VOWEL_DELETE_TABLE = str.maketrans('', '', ''.join(VOWELS))
     MAX_EXPANDED_CANDIDATES = 10
     MAX_LETTERS_PER_POSITION_FOR_EXPANSION = 5
+    FEEDBACK_CACHE_SIZE = 256
+    CANDIDATE_BITMAP_RATIO = 4  # candidate bitmaps pay off once 1 in 4 indexed words survive
+    SPARSE_BITMAP_RATIO = 16  # bitmaps with at most 1 in 16 bits set are decoded bit by bit
+    _FEEDBACK_RE = re.compile(r'[A-Za-z.]*')  # ASCII green/yellow feedback (fast accept path)
+    # Per-byte translation tables: byte value `code` maps to b'1', every other byte to b'0'
+    _BIT_TABLES = [b'0' * code + b'1' + b'0' * (255 - code) for code in range(256)]
+    _SELECTOR_TABLE = bytes.maketrans(b'01', b'\x00\x01')  # binary digits to compress() selectors
+    _GREY_LETTERS_RE = re.compile(r'\s*(?:[A-Za-z](?:\s+[A-Za-z])*)?\s*')  # ASCII grey letters (fast accept path)
+    _FREQ_RE = re.compile(r'(\S+)\s*$')  # last field of a "frequency letter" or "letter" line
     
     def __init__(self, frequency_dir: Optional[str] = None, words_file: Optional[str] = None):
         """
@@ -56,26 +84,35 @@ class WordleSolver:
             frequency_dir = os.path.join(project_root, 'lib')
         if words_file is None:
             words_file = os.path.join(project_root, 'lib', 'wordle-words.txt')
-        self.positional_frequencies: Dict[int, str] = {}
-        self.valid_words: Set[str] = set()
+        # Frequency files are parsed while loading: letters in file order, plus letter -> line number
+        # (a table that scores PENALTY_SCORE for letters it lacks, so scoring needs no default)
+        self.positional_frequencies: Dict[int, List[str]] = {}
+        self._letter_ranks: Dict[int, Dict[str, int]] = {}
+        self.valid_words: FrozenSet[str] = frozenset()
         
-        # Load frequency files for positions 1-5
+        # Load frequency files for positions 1-5 (missing files are skipped)
         for pos in range(1, self.WORD_LENGTH + 1):
             filepath = os.path.join(frequency_dir, f'pos{pos}.txt')
-            if os.path.exists(filepath):
-                try:
-                    with open(filepath, 'r') as f:
-                        self.positional_frequencies[pos] = f.read()
-                except IOError as e:
-                    raise IOError(f"Failed to load frequency file {filepath}: {e}") from e
-        
-        # Load valid Wordle words
-        if os.path.exists(words_file):
             try:
-                with open(words_file, 'r') as f:
-                    self.valid_words = {line.strip().lower() for line in f if line.strip()}
+                with open(filepath, 'r') as f:
+                    self.positional_frequencies[pos], self._letter_ranks[pos] = self._parse_frequency_lines(f)
+            except FileNotFoundError:
+                # Every letter at a position without a file scores PENALTY_SCORE
+                self._letter_ranks[pos] = _PenaltyRanks({}, self.PENALTY_SCORE)
+                continue
             except IOError as e:
-                raise IOError(f"Failed to load word list {words_file}: {e}") from e
+                raise IOError(f"Failed to load frequency file {filepath}: {e}") from e
+        
+        # Load valid Wordle words (a missing file leaves the word list empty)
+        try:
+            with open(words_file, 'r') as f:
+                # One read + split handles stripping and blank lines in C; interned words
+                # are shared with the index structures built from them
+                self.valid_words = set(map(sys.intern, f.read().lower().split()))
+        except FileNotFoundError:
+            pass
+        except IOError as e:
+            raise IOError(f"Failed to load word list {words_file}: {e}") from e
         
         # Requirement 5.2: Maintain minimal state (only green/yellow/grey constraints and candidate words)
         self.green_constraints: Dict[int, str] = {}  # position -> letter mapping
@@ -83,6 +120,222 @@ class WordleSolver:
         self.grey_constraints: Set[str] = set()  # set of excluded letters
         self.candidate_words: Set[str] = set()  # filtered candidate words
     
+    @classmethod
+    def _parse_frequency_lines(cls, lines: Iterable[str]) -> Tuple[List[str], Dict[str, int]]:
+        """
+        Parse positional frequency file lines in a single streaming pass
+        
+        Each line has the format "frequency letter" (e.g., "1132 s") or just "letter".
+        Line numbers are counted from the first non-blank line.
+        
+        Args:
+            lines: Lines of a positional frequency file
+            
+        Returns:
+            Tuple of (letters in file order, letter -> first line number mapping that returns
+            PENALTY_SCORE for letters not in the file)
+        """
+        letters: List[str] = []
+        ranks: Dict[str, int] = _PenaltyRanks({}, cls.PENALTY_SCORE)
+        line_num = 0
+        last_field = cls._FREQ_RE.search
+        for line in lines:
+            match = last_field(line)
+            if not match and not line_num:
+                continue  # Leading blank lines are not counted
+            line_num += 1
+            if not match:
+                continue
+            # The letter is the last field in both formats
+            letter = match.group(1).lower()
+            ranks.setdefault(letter, line_num)
+            if letter.isalpha():
+                letters.append(letter)
+        return letters, ranks
+    
+    @property
+    def valid_words(self) -> FrozenSet[str]:
+        """
+        Frozen set of valid Wordle words; assigning a new set rebuilds the bitmap index
+        
+        The set is frozen because the index is only rebuilt on assignment: an in-place
+        change would otherwise be silently ignored by filtering.
+        """
+        return self._valid_words
+    
+    @valid_words.setter
+    def valid_words(self, words: Iterable[str]) -> None:
+        self._valid_words = frozenset(words)
+        self._index_words()
+        # The previous filter result (for incremental filtering) indexes the old word list
+        self._last_filter: Optional[Tuple[Tuple, int]] = None
+        # Cached feedback results are only valid for the word list they were computed from
+        self._feedback_cache: "OrderedDict[Tuple, Tuple[Optional[List[str]], Optional[int], List[Dict[str, Any]]]]" = OrderedDict()
+    
+    @property
+    def candidate_words(self) -> Set[str]:
+        """Set of filtered candidate words; reading or assigning it discards the cached sort order and bitmap"""
+        if self._candidate_words is None:
+            # Filtering stores only the sorted list; build the set on first external use
+            self._candidate_words = set(self._sorted_candidates)
+        # The caller may change the returned set in place, which neither the bitmap nor the
+        # sorted list would reflect
+        self._candidate_bits = None
+        self._sorted_candidates = None
+        return self._candidate_words
+    
+    @candidate_words.setter
+    def candidate_words(self, words: Set[str]) -> None:
+        self._candidate_words = words
+        self._sorted_candidates: Optional[List[str]] = None
+        self._candidate_bits: Optional[int] = None
+    
+    def _set_sorted_candidates(self, sorted_words: List[str], bits: Optional[int] = None) -> None:
+        """
+        Replace the candidate set with words that are already in alphabetical order
+        
+        Args:
+            sorted_words: Candidate words, sorted alphabetically
+            bits: Optional bitmap of the same words over the indexed words, letting the
+                vowel and uniqueness queries run as bitwise operations
+        """
+        self._candidate_words = None
+        self._sorted_candidates = sorted_words
+        self._candidate_bits = bits
+    
+    def _candidate_view(self) -> Collection[str]:
+        """
+        Get the candidates in whichever container is already built, without materializing the set
+        
+        Returns:
+            Candidate set, or the sorted candidate list when the set has not been built
+        """
+        if self._candidate_words is not None:
+            return self._candidate_words
+        return self._sorted_candidates
+    
+    def _get_sorted_candidates(self) -> List[str]:
+        """
+        Get candidate words in alphabetical order, sorting at most once per candidate set
+        
+        Returns:
+            Sorted list of candidate words (shared; callers must not mutate it)
+        """
+        if self._sorted_candidates is None:
+            self._sorted_candidates = sorted(self._candidate_words)
+        return self._sorted_candidates
+    
+    def _index_words(self) -> None:
+        """
+        Build bitmap indexes over the valid words
+        
+        Every well-formed word (WORD_LENGTH lowercase letters) is assigned a bit by its
+        position in sorted order. For each (position, letter) pair and for each letter,
+        an int bitmap records which words match, so filter_candidates can apply every
+        constraint as a single bitwise operation.
+        """
+        # A word is well formed when it has WORD_LENGTH characters and stripping every
+        # lowercase ASCII letter leaves nothing; a length test and one C-level strip suffice
+        lowercase = string.ascii_lowercase
+        word_length = self.WORD_LENGTH
+        self._indexed_words: List[str] = sorted(
+            w for w in self._valid_words if len(w) == word_length and not w.strip(lowercase)
+        )
+        
+        # Lay the words out as one ASCII byte string; slicing with a WORD_LENGTH step yields
+        # the column of letters at each position without a per-character Python loop
+        blob = ''.join(self._indexed_words).encode('ascii')
+        self._position_bits: List[Dict[str, int]] = []
+        for pos in range(self.WORD_LENGTH):
+            column = blob[pos::self.WORD_LENGTH]
+            self._position_bits.append({
+                chr(code): self._bits_where(column, code)
+                for code in set(column)
+            })
+        self._letter_bits: Dict[str, int] = {}
+        for pos_bits in self._position_bits:
+            for letter, bits in pos_bits.items():
+                self._letter_bits[letter] = self._letter_bits.get(letter, 0) | bits
+        self._all_bits = (1 << len(self._indexed_words)) - 1
+        
+        # Per-word features that never change once the word list is loaded
+        self._vowel_counts: Dict[str, int] = {word: self._count_vowels(word) for word in self._indexed_words}
+        self._unique_letter_flags: Dict[str, bool] = {
+            word: self._has_unique_letters(word) for word in self._indexed_words
+        }
+        
+        # The same features as bitmaps, for candidate sets that carry their own bitmap
+        vowel_counts = bytes(self._vowel_counts[word] for word in self._indexed_words)
+        self._vowel_count_bits: List[int] = [
+            self._bits_where(vowel_counts, count) for count in range(self.WORD_LENGTH + 1)
+        ]
+        unique_flags = bytes(self._unique_letter_flags[word] for word in self._indexed_words)
+        self._unique_bits = self._bits_where(unique_flags, True)
+    
+    @classmethod
+    def _bits_where(cls, values: bytes, code: int) -> int:
+        """
+        Build an int bitmap of the indexes at which a byte string holds a given value
+        
+        Args:
+            values: One byte per indexed word
+            code: Byte value to look for
+            
+        Returns:
+            Int bitmap with bit i set where values[i] == code
+        """
+        # Translate to b'0'/b'1' per byte and parse as binary (reversed so byte i becomes bit i)
+        return int(b'0' + values.translate(cls._BIT_TABLES[code])[::-1], 2)
+    
+    def _use_candidate_bits(self) -> bool:
+        """
+        Decide whether candidate queries should use the candidate bitmap
+        
+        Bitmap operations cost the same regardless of how many candidates survive, so small
+        candidate sets (most rounds after the first) are cheaper to walk word by word.
+        
+        Returns:
+            True if a candidate bitmap is available and the candidate set is large enough
+        """
+        return (
+            self._candidate_bits is not None
+            and len(self._candidate_view()) * self.CANDIDATE_BITMAP_RATIO >= len(self._indexed_words)
+        )
+    
+    def _bits_to_words(self, bits: int) -> List[str]:
+        """
+        Convert an int bitmap over indexed words back into words
+        
+        Args:
+            bits: Int bitmap (bit i set means the i-th indexed word is included)
+            
+        Returns:
+            List of words in sorted order
+        """
+        words = self._indexed_words
+        # Special cases: no constraint removed anything, or the constraints pinned a single
+        # word (e.g. five greens), need no decoding at all
+        if bits == self._all_bits:
+            return list(words)
+        if not bits & (bits - 1):
+            return [words[bits.bit_length() - 1]] if bits else []
+        
+        # Reverse the binary string so that character i corresponds to bit i
+        binary = bin(bits)[:1:-1]
+        if binary.count('1') * self.SPARSE_BITMAP_RATIO > len(binary):
+            # Dense bitmap: select words in C with b'\x00'/b'\x01' selector bytes
+            return list(compress(words, binary.encode('ascii').translate(self._SELECTOR_TABLE)))
+        
+        # Sparse bitmap (typical late in a game): peel off the highest set bit each step, which
+        # also shortens the int, so the cost follows the number of words rather than the width
+        result = []
+        while bits:
+            index = bits.bit_length() - 1
+            result.append(words[index])
+            bits ^= 1 << index
+        result.reverse()
+        return result
+    
     def extract_top_letters(self, position: int, n: int) -> List[str]:
         """
         Extract top-N letters per position from frequency files
@@ -96,29 +349,8 @@ class WordleSolver:
         Returns:
             List of top N letters for the given position
         """
-        if position not in self.positional_frequencies:
-            return []
-        
-        # Parse file content - format is "frequency letter" (e.g., "1132 s") or just "letter"
-        content = self.positional_frequencies[position]
-        letters = []
-        for line in content.strip().split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            # Parse format: "frequency letter" or just "letter"
-            parts = line.split()
-            if len(parts) >= 2:
-                # Format: "frequency letter" - take the last part (letter)
-                letter = parts[-1].lower()
-            else:
-                # Format: just "letter" - backward compatibility
-                letter = parts[0].lower()
-            if letter and letter.isalpha():
-                letters.append(letter)
-        
-        # Return top N letters
-        return letters[:n]
+        # Letters are parsed in frequency order when the files are loaded
+        return self.positional_frequencies.get(position, [])[:n]
     
     def get_letter_line_number(self, position: int, letter: str) -> Optional[int]:
         """
@@ -131,28 +363,48 @@ class WordleSolver:
         Returns:
             Line number (1-indexed) where letter appears, or None if not found
         """
-        if position not in self.positional_frequencies:
-            return None
+        return self._letter_ranks.get(position, {}).get(letter.lower())
+    
+    @staticmethod
+    def _score_words(
+        words: Iterable[str],
+        rank_tables: List[Tuple[int, Dict[str, int]]]
+    ) -> List[Tuple[str, int]]:
+        """
+        Scoring kernel: sum the rank of each word's letter at every unknown position
         
-        letter_lower = letter.lower()
-        content = self.positional_frequencies[position]
-        lines = content.strip().split('\n')
+        Args:
+            words: Words to score
+            rank_tables: List of (0-indexed position, letter-to-line-number table) pairs; the
+                tables score missing letters themselves (see _PenaltyRanks)
         
-        for line_num, line in enumerate(lines, start=1):
-            line = line.strip()
-            if not line:
-                continue
-            # Parse format: "frequency letter" or just "letter"
-            parts = line.split()
-            if len(parts) >= 2:
-                file_letter = parts[-1].lower()
-            else:
-                file_letter = parts[0].lower()
-            
-            if file_letter == letter_lower:
-                return line_num
+        Returns:
+            List of (word, score) tuples in input order
+        """
+        words = list(words)
+        # Loaded words are already lowercase; only lowercase word-by-word when some are not
+        letters = words if ''.join(words).islower() else list(map(str.lower, words))
+        # Score column by column: each unknown position adds its ranks for all words in one
+        # map() pass, so the per-word loop runs in C rather than in the interpreter
+        totals: Iterable[int] = repeat(0, len(words))
+        for index, ranks in rank_tables:
+            column = map(itemgetter(index), letters)
+            # The penalty is folded into the table, so each lookup is a plain subscript
+            totals = map(add, totals, map(ranks.__getitem__, column))
+        return list(zip(words, totals))
+    
+    def _unknown_position_rank_tables(self) -> List[Tuple[int, Dict[str, int]]]:
+        """
+        Collect rank tables for every unknown position (positions not in green_constraints)
         
-        return None
+        Returns:
+            List of (0-indexed position, letter-to-line-number table) pairs
+        """
+        return [
+            (pos - 1, self._letter_ranks[pos])
+            for pos in range(1, self.WORD_LENGTH + 1)
+            if pos not in self.green_constraints
+        ]
     
     def compute_word_scores(self, candidate_words: Optional[Set[str]] = None) -> List[Tuple[str, int]]:
         """
@@ -167,37 +419,67 @@ class WordleSolver:
         Returns:
             List of (word, score) tuples sorted by score (lowest first)
         """
-        words = candidate_words if candidate_words is not None else self.candidate_words
+        words = candidate_words if candidate_words is not None else self._candidate_view()
+        return self._rank_words(words, words is self._sorted_candidates)
+    
+    def _rank_words(self, words: Iterable[str], alphabetical: bool) -> List[Tuple[str, int]]:
+        """
+        Score words and sort them by score, then alphabetically
+        
+        Args:
+            words: Words to score
+            alphabetical: True if words are already in alphabetical order, so ties need no
+                string comparisons
+        
+        Returns:
+            List of (word, score) tuples sorted by score (lowest first)
+        """
         if not words:
             return []
         
-        # Find unknown positions (positions not in green_constraints)
-        unknown_positions = [pos for pos in range(1, self.WORD_LENGTH + 1) if pos not in self.green_constraints]
+        rank_tables = self._unknown_position_rank_tables()
         
-        if not unknown_positions:
+        if not rank_tables:
             # All positions are known, return words with score 0
-            return [(word, 0) for word in sorted(words)]
+            return [(word, 0) for word in (words if alphabetical else sorted(words))]
         
-        scored_words = []
-        
-        for word in words:
-            score = 0
-            for pos in unknown_positions:
-                letter = word[pos - 1].lower()  # Get letter at this position (0-indexed: pos-1)
-                line_num = self.get_letter_line_number(pos, letter)
-                if line_num is not None:
-                    score += line_num
-                else:
-                    # Letter not found in frequency file - assign high penalty score
-                    score += self.PENALTY_SCORE
-            
-            scored_words.append((word, score))
+        # Letters not found in a frequency file are assigned PENALTY_SCORE
+        scored_words = self._score_words(words, rank_tables)
         
         # Sort by score (lowest first), then alphabetically for ties
-        scored_words.sort(key=lambda x: (x[1], x[0]))
+        self._sort_scored_words(scored_words, alphabetical)
         
         return scored_words
     
+    @staticmethod
+    def _sort_scored_words(scored_words: List[Tuple[str, int]], alphabetical: bool) -> None:
+        """
+        Sort (word, score) tuples in place by score, then alphabetically for ties
+        
+        Args:
+            scored_words: List of (word, score) tuples
+            alphabetical: True if the tuples are already in alphabetical order by word
+        """
+        if alphabetical:
+            # The sort is stable, so ordering by score alone keeps ties alphabetical
+            scored_words.sort(key=itemgetter(1))
+        else:
+            scored_words.sort(key=itemgetter(1, 0))
+    
+    def _count_vowels(self, word: str) -> int:
+        """
+        Count the vowels in a word (case insensitive)
+        
+        Args:
+            word: Word to inspect
+            
+        Returns:
+            Number of vowel characters in the word
+        """
+        # Deleting the vowels in one C-level translate() pass leaves the consonants behind
+        letters = word.lower()
+        return len(letters) - len(letters.translate(self._VOWEL_DELETE_TABLE))
+    
     def get_words_with_most_vowels(self) -> Set[str]:
         """
         Get words with the most vowels from candidate words
@@ -207,14 +489,21 @@ class WordleSolver:
         Returns:
             Set of words with the highest vowel count
         """
-        if not self.candidate_words:
+        if not self._candidate_view():
             return set()
         
+        if self._use_candidate_bits():
+            return set(self._bits_to_words(self._most_vowel_bits()))
+        
         max_vowel_count = 0
         vowel_words = set()
+        vowel_counts = self._vowel_counts
         
-        for word in self.candidate_words:
-            vowel_count = sum(1 for char in word.lower() if char in self.VOWELS)
+        for word in self._candidate_view():
+            # Counts are precomputed for indexed words; fall back for anything else
+            vowel_count = vowel_counts.get(word)
+            if vowel_count is None:
+                vowel_count = self._count_vowels(word)
             if vowel_count > max_vowel_count:
                 max_vowel_count = vowel_count
                 vowel_words = {word}
@@ -223,6 +512,20 @@ class WordleSolver:
         
         return vowel_words
     
+    def _most_vowel_bits(self) -> int:
+        """
+        Get the bitmap of candidates with the most vowels (requires the candidate bitmap)
+        
+        Returns:
+            Int bitmap of the candidates with the highest vowel count
+        """
+        # The highest vowel count present among the candidates is the first non-empty AND
+        for count_bits in reversed(self._vowel_count_bits):
+            bits = self._candidate_bits & count_bits
+            if bits:
+                return bits
+        return 0
+    
     def get_suggested_next_guess(self) -> Optional[List[Tuple[str, int]]]:
         """
         Get suggested next guess using vowel prioritization and positional frequency scoring
@@ -234,26 +537,44 @@ class WordleSolver:
         Returns:
             List of (word, score) tuples sorted by score (lowest first), or None if no candidates
         """
-        if not self.candidate_words:
+        if not self._candidate_view():
             return None
         
-        # Requirement 3.4: Get words with most vowels
-        vowel_words = self.get_words_with_most_vowels()
-        
-        if not vowel_words:
-            # Fallback to all candidates if no vowels found (shouldn't happen with valid words)
-            vowel_words = self.candidate_words
-        
-        # Requirement 3.5: Score the vowel-rich words
-        # Pass vowel_words as parameter instead of mutating state
-        scored_words = self.compute_word_scores(candidate_words=vowel_words)
+        if self._use_candidate_bits():
+            # Requirement 3.4 & 3.5: Vowel selection is a few bitmap ANDs, so score only the winners
+            # (decoded in alphabetical order)
+            return self._rank_words(self._bits_to_words(self._most_vowel_bits()), True)
+        
+        # Requirement 3.4 & 3.5: Select the words with the most vowels and score them in a
+        # single pass. A word is scored only while it ties the best vowel count seen so far;
+        # a strictly higher count discards the words scored so far.
+        rank_tables = self._unknown_position_rank_tables()
+        vowel_counts = self._vowel_counts
+        max_vowel_count = -1
+        scored_words = []
+        candidates = self._candidate_view()
         
-        if scored_words:
-            # Requirement 3.5.1: Return all scored words
-            return scored_words
+        for word in candidates:
+            vowel_count = vowel_counts.get(word)
+            # Indexed words are stored lowercase, so only other words need lowercasing
+            letters = word
+            if vowel_count is None:
+                vowel_count = self._count_vowels(word)
+                letters = word.lower()
+            if vowel_count < max_vowel_count:
+                continue
+            if vowel_count > max_vowel_count:
+                max_vowel_count = vowel_count
+                scored_words = []
+            
+            score = 0
+            for index, ranks in rank_tables:
+                score += ranks[letters[index]]
+            scored_words.append((word, score))
         
-        # Fallback: create scored list from vowel words with score 0
-        return [(word, 0) for word in sorted(vowel_words)]
+        # Requirement 3.5.1: Return all scored words, lowest score first, alphabetical for ties
+        self._sort_scored_words(scored_words, candidates is self._sorted_candidates)
+        return scored_words
     
     def get_default_first_guess(self) -> str:
         """
@@ -304,11 +625,7 @@ class WordleSolver:
         Returns:
             Dictionary mapping position (1-indexed) to letter
         """
-        mapping = {}
-        for i, char in enumerate(green_string, start=1):
-            if char != '.':
-                mapping[i] = char.upper()
-        return mapping
+        return {i: char for i, char in enumerate(green_string.upper(), start=1) if char != '.'}
     
     def prompt_for_yellow_letters(self) -> str:
         """
@@ -335,13 +652,10 @@ class WordleSolver:
         Returns:
             Dictionary mapping letter to set of excluded positions (1-indexed)
         """
-        mapping = {}
-        for i, char in enumerate(yellow_string, start=1):
-            if char != '.':
-                letter = char.upper()
-                if letter not in mapping:
-                    mapping[letter] = set()
-                mapping[letter].add(i)
+        mapping: Dict[str, Set[int]] = {}
+        for i, letter in enumerate(yellow_string.upper(), start=1):
+            if letter != '.':
+                mapping.setdefault(letter, set()).add(i)
         return mapping
     
     def prompt_for_grey_letters(self) -> str:
@@ -372,6 +686,10 @@ class WordleSolver:
         if not grey_string:
             return True, ""  # Empty is valid (no grey letters)
         
+        # Fast path: a single precompiled match accepts well-formed ASCII input
+        if self._GREY_LETTERS_RE.fullmatch(grey_string):
+            return True, ""
+        
         # Check that all characters are letters or spaces
         for char in grey_string:
             if not (char.isalpha() or char.isspace()):
@@ -401,7 +719,21 @@ class WordleSolver:
         """
         if not grey_string:
             return set()
-        return {letter.upper() for letter in grey_string.split() if letter.strip()}
+        # split() drops surrounding and repeated whitespace, so no field is blank
+        return set(grey_string.upper().split())
+    
+    @staticmethod
+    def _has_unique_letters(word: str) -> bool:
+        """
+        Check whether a word has no repeated letters (case insensitive)
+        
+        Args:
+            word: Word to inspect
+            
+        Returns:
+            True if every letter in the word is distinct, False otherwise
+        """
+        return len(set(word.lower())) == len(word)
     
     def split_candidates_by_letter_uniqueness(self) -> Tuple[Set[str], Set[str]]:
         """
@@ -412,18 +744,40 @@ class WordleSolver:
         Returns:
             Tuple of (unique_letters_words, repeated_letters_words) sets
         """
-        unique_words = set()
-        repeated_words = set()
+        unique_words, repeated_words = self._split_sorted_candidates()
+        return set(unique_words), set(repeated_words)
+    
+    def _split_sorted_candidates(self) -> Tuple[List[str], List[str]]:
+        """
+        Split candidate words by letter uniqueness, keeping both sections in alphabetical order
+        
+        Returns:
+            Tuple of (unique_letters_words, repeated_letters_words) sorted lists
+        """
+        if self._use_candidate_bits():
+            # Bitmaps decode in index order, which is alphabetical
+            bits = self._candidate_bits
+            return (
+                self._bits_to_words(bits & self._unique_bits),
+                self._bits_to_words(bits & ~self._unique_bits),
+            )
         
-        for word in self.candidate_words:
-            # Check if word has all unique letters
-            letter_set = set(word.lower())
-            if len(letter_set) == len(word):
+        unique_words = []
+        repeated_words = []
+        unique_letter_flags = self._unique_letter_flags
+        
+        # Partitioning the sorted candidates keeps each section sorted without re-sorting it
+        for word in self._get_sorted_candidates():
+            # Flags are precomputed for indexed words; fall back for anything else
+            is_unique = unique_letter_flags.get(word)
+            if is_unique is None:
+                is_unique = self._has_unique_letters(word)
+            if is_unique:
                 # All letters are unique
-                unique_words.add(word)
+                unique_words.append(word)
             else:
                 # Has repeated letters
-                repeated_words.add(word)
+                repeated_words.append(word)
         
         return unique_words, repeated_words
     
@@ -436,30 +790,51 @@ class WordleSolver:
         Requirement 5.3: Provide clear, human-readable prompts and feedback messages
         
         """
-        if not self.candidate_words:
+        if not self._candidate_view():
             print("No candidate words found.")
             return
         
         # Requirement 3.2: Split into unique letters and repeated letters sections
-        unique_words, repeated_words = self.split_candidates_by_letter_uniqueness()
+        unique_words, repeated_words = self._split_sorted_candidates()
         
-        print(f"\nFound {len(self.candidate_words)} candidate word(s):")
+        print(f"\nFound {len(self._candidate_view())} candidate word(s):")
         
         # Section 1: Words with unique letters
         if unique_words:
             print(f"\nSection 1 - Unique letters ({len(unique_words)} word(s)):")
-            sorted_unique = sorted(unique_words)
-            for i in range(0, len(sorted_unique), self.WORDS_PER_LINE):
-                line_words = sorted_unique[i:i+self.WORDS_PER_LINE]
-                print("  " + " ".join(word.upper() for word in line_words))
+            print(self._format_word_rows(unique_words))
         
         # Section 2: Words with repeated letters
         if repeated_words:
             print(f"\nSection 2 - Repeated letters ({len(repeated_words)} word(s)):")
-            sorted_repeated = sorted(repeated_words)
-            for i in range(0, len(sorted_repeated), self.WORDS_PER_LINE):
-                line_words = sorted_repeated[i:i+self.WORDS_PER_LINE]
-                print("  " + " ".join(word.upper() for word in line_words))
+            print(self._format_word_rows(repeated_words))
+    
+    def _format_word_rows(self, words: List[str]) -> str:
+        """
+        Format words as indented rows of WORDS_PER_LINE uppercase words
+        
+        Args:
+            words: Words to format, in display order
+        
+        Returns:
+            Newline-separated rows, ready to be printed in a single call
+        """
+        rows = [
+            "  " + " ".join(words[i:i + self.WORDS_PER_LINE])
+            for i in range(0, len(words), self.WORDS_PER_LINE)
+        ]
+        return "\n".join(rows).upper()
+    
+    def display_default_guess(self, word: Optional[str] = None) -> None:
+        """
+        Display a single suggested next guess when there are no scored words
+        
+        Requirement 4.6: Display suggested next guess after all constraints are applied
+        
+        Args:
+            word: Word to suggest. If None, uses the default first guess.
+        """
+        print(f"\nSuggested next guess: {word or self.get_default_first_guess()}")
     
     def display_suggested_guess(self, scored_words: Optional[List[Tuple[str, int]]] = None) -> None:
         """
@@ -470,22 +845,19 @@ class WordleSolver:
         Requirement 5.3: Provide clear, human-readable prompts and feedback messages
         
         Args:
-            scored_words: List of (word, score) tuples, or None/string for default first guess
-        """
-        if scored_words is None:
-            # No candidates, show default first guess
-            print(f"\nSuggested next guess: {self.get_default_first_guess()}")
-        elif isinstance(scored_words, str):
-            # Backward compatibility: single word string
-            print(f"\nSuggested next guess: {scored_words}")
-        elif isinstance(scored_words, list) and len(scored_words) > 0:
-            # Requirement 3.5.1: Display all scored words with scores
-            print("\nSuggested next guess:")
-            for word, score in scored_words:
-                print(f"  {word.upper()} (score: {score})")
-        else:
-            # Empty list, fallback to default
-            print(f"\nSuggested next guess: {self.get_default_first_guess()}")
+            scored_words: List of (word, score) tuples. A single word string, None or an empty
+                list is still accepted and shown via display_default_guess.
+        """
+        if not scored_words or isinstance(scored_words, str):
+            # Backward compatibility: callers that know they have no scored words should use
+            # display_default_guess directly
+            self.display_default_guess(scored_words or None)
+            return
+        
+        # Requirement 3.5.1: Display all scored words with scores
+        print("\nSuggested next guess:")
+        for word, score in scored_words:
+            print(f"  {word.upper()} (score: {score})")
     
     def validate_guess(self, guess: str) -> Tuple[bool, str]:
         """
@@ -507,6 +879,20 @@ class WordleSolver:
             return False, "Error: Guess must contain only letters."
         return True, ""
     
+    @classmethod
+    def _is_feedback_string(cls, feedback: str) -> bool:
+        """
+        Check that a green/yellow feedback string contains only letters and dots
+        
+        Args:
+            feedback: Feedback string
+            
+        Returns:
+            True if every character is a letter or a dot
+        """
+        # ASCII input is accepted by one precompiled match; other letters need isalpha()
+        return bool(cls._FEEDBACK_RE.fullmatch(feedback)) or all(c.isalpha() or c == '.' for c in feedback)
+    
     def validate_green_letters(self, green_string: str) -> Tuple[bool, str]:
         """
         Validate green letters input format
@@ -523,7 +909,7 @@ class WordleSolver:
             return False, "Error: Green letters feedback cannot be empty."
         if len(green_string) != self.WORD_LENGTH:
             return False, f"Error: Green letters must be exactly {self.WORD_LENGTH} characters (got {len(green_string)})."
-        if not all(c.isalpha() or c == '.' for c in green_string):
+        if not self._is_feedback_string(green_string):
             return False, "Error: Green letters must contain only letters and dots."
         return True, ""
     
@@ -543,7 +929,7 @@ class WordleSolver:
             return True, ""  # Empty is valid (no yellow letters)
         if len(yellow_string) != self.WORD_LENGTH:
             return False, f"Error: Yellow letters must be exactly {self.WORD_LENGTH} characters (got {len(yellow_string)})."
-        if not all(c.isalpha() or c == '.' for c in yellow_string):
+        if not self._is_feedback_string(yellow_string):
             return False, "Error: Yellow letters must contain only letters and dots."
         return True, ""
     
@@ -567,7 +953,8 @@ class WordleSolver:
         while True:
             try:
                 user_input = prompt_func()
-                if user_input.upper() == 'QUIT':
+                upper_input = user_input.upper()
+                if upper_input == 'QUIT':
                     print("Exiting Wordle Solver. Goodbye!")
                     return None
                 
@@ -575,7 +962,7 @@ class WordleSolver:
                 if is_valid:
                     if convert_func:
                         return convert_func(user_input)
-                    return user_input.upper()
+                    return upper_input
                 else:
                     print(error_msg)
                     print("Please try again.")
@@ -658,12 +1045,13 @@ class WordleSolver:
             self.display_candidates()
             
             # Requirement 4.6: Display suggested next guess
-            # Convert suggestions back to format expected by display_suggested_guess
+            # Convert suggestions back to format expected by display_suggested_guess; the words
+            # are already uppercase, which is how they are displayed, so no case round trip
             if result["suggestions"]:
-                scored_words = [(s["word"].lower(), s["score"]) for s in result["suggestions"]]
+                scored_words = [(s["word"], s["score"]) for s in result["suggestions"]]
                 self.display_suggested_guess(scored_words)
             else:
-                self.display_suggested_guess(None)
+                self.display_default_guess()
             
             round_num += 1
     
@@ -680,6 +1068,7 @@ class WordleSolver:
         This method processes feedback without user interaction, maintaining the same
         core logic as the interactive solve() method. It merges constraints across
         rounds to ensure discoveries from previous rounds are applied in future rounds.
+        Results are memoized on the merged constraints (up to FEEDBACK_CACHE_SIZE states).
         
         Args:
             guess: The guessed word (e.g., "saint")
@@ -708,14 +1097,14 @@ class WordleSolver:
             raise ValueError(f"Greens must be a non-empty string")
         if len(greens) != self.WORD_LENGTH:
             raise ValueError(f"Greens must be exactly {self.WORD_LENGTH} characters (got {len(greens)})")
-        if not all(c.isalpha() or c == '.' for c in greens):
+        if not self._is_feedback_string(greens):
             raise ValueError("Greens must contain only letters and dots")
         
         if not yellows or not isinstance(yellows, str):
             raise ValueError(f"Yellows must be a non-empty string")
         if len(yellows) != self.WORD_LENGTH:
             raise ValueError(f"Yellows must be exactly {self.WORD_LENGTH} characters (got {len(yellows)})")
-        if not all(c.isalpha() or c == '.' for c in yellows):
+        if not self._is_feedback_string(yellows):
             raise ValueError("Yellows must contain only letters and dots")
         
         if not isinstance(greys, list):
@@ -742,193 +1131,263 @@ class WordleSolver:
         
         self.grey_constraints.update(greys_upper)
         
-        # Requirement 5.1: Filter candidate words using regex-based filtering
-        self.filter_candidates()
-        
-        # Get candidate words as sorted list
-        candidates = sorted(self.candidate_words)
-        
-        # Requirement 3.4 & 3.5: Get suggested guesses with scores
-        scored_words = self.get_suggested_next_guess()
-        
-        # Format suggestions as list of dicts
-        suggestions = []
-        if scored_words:
-            for word, score in scored_words:
-                suggestions.append({"word": word.upper(), "score": score})
-        
+        # Results depend only on the merged constraints, so identical states are served
+        # from the cache without refiltering or rescoring
+        cache_key = self._constraint_key()
+        cached = self._feedback_cache.get(cache_key)
+        if cached is not None:
+            self._feedback_cache.move_to_end(cache_key)
+            cached_words, candidate_bits, suggestions = cached
+            if candidate_bits is not None:
+                candidates = self._bits_to_words(candidate_bits)
+            else:
+                # The sorted list is shared read-only, so the cached list can back it directly
+                candidates = cached_words
+            self._set_sorted_candidates(candidates, candidate_bits)
+        else:
+            # Requirement 5.1: Filter candidate words using bitmap-based filtering
+            self._filter_candidates(cache_key)
+            
+            # Get candidate words as sorted list (bitmap filtering already yields them in order);
+            # the returned dict gets its own copy below
+            candidates = self._get_sorted_candidates()
+            
+            # Requirement 3.4 & 3.5: Get suggested guesses with scores
+            scored_words = self.get_suggested_next_guess()
+            
+            # Format suggestions as list of dicts
+            suggestions = []
+            if scored_words:
+                for word, score in scored_words:
+                    suggestions.append({"word": word.upper(), "score": score})
+            
+            # Filtered candidates are cached as their compact bitmap alone; only expanded
+            # candidates (which have no bitmap) keep a word list
+            candidate_bits = self._candidate_bits
+            cached_words = candidates if candidate_bits is None else None
+            self._feedback_cache[cache_key] = (cached_words, candidate_bits, suggestions)
+            if len(self._feedback_cache) > self.FEEDBACK_CACHE_SIZE:
+                self._feedback_cache.popitem(last=False)
+        
+        # Return copies so callers cannot mutate cached results
         return {
-            "candidates": candidates,
-            "suggestions": suggestions
+            "candidates": list(candidates),
+            "suggestions": [dict(suggestion) for suggestion in suggestions]
         }
     
-    def _word_matches_yellow_constraints(self, word: str) -> bool:
+    def _constraint_key(self) -> Tuple[Tuple, Tuple, Tuple]:
         """
-        Check if word satisfies all yellow letter constraints
+        Build a hashable fingerprint of the current green/yellow/grey constraints
         
-        Args:
-            word: Word to check (lowercase)
-            
         Returns:
-            True if word satisfies all yellow constraints, False otherwise
-        """
-        for yellow_letter, excluded_positions in self.yellow_constraints.items():
-            if yellow_letter.lower() not in word:
-                return False
-            for excluded_pos in excluded_positions:
-                if word[excluded_pos - 1] == yellow_letter.lower():
-                    return False
-        return True
+            Tuple of (green items, yellow items, grey letters), each sorted
+        """
+        return (
+            tuple(sorted(self.green_constraints.items())),
+            tuple(sorted(
+                (letter, tuple(sorted(positions))) for letter, positions in self.yellow_constraints.items()
+            )),
+            tuple(sorted(self.grey_constraints)),
+        )
     
-    def _build_position_pattern(self, pos: int, green_letter: Optional[str], excluded_letters: Set[str]) -> str:
+    def filter_candidates(self) -> None:
         """
-        Build regex pattern for a single position
+        Filter candidate words using bitmap-based constraints
         
-        Args:
-            pos: Position number (1-indexed)
-            green_letter: Fixed letter for this position (if any)
-            excluded_letters: Set of letters to exclude from this position
-            
-        Returns:
-            Regex pattern string for this position
-        """
-        if green_letter:
-            return green_letter.lower()
-        if excluded_letters:
-            excluded_chars = ''.join(sorted(excluded_letters))
-            return f'[^{excluded_chars}]'
-        return '[a-z]'
-    
-    def _filter_grey_letters(self, candidates: Set[str]) -> Set[str]:
-        """
-        Filter out words containing grey letters
+        Requirement 5.1: Efficient constraint application (bitmap index over valid words)
+        Requirement 3.1.1: Green letters: Fixed positions specified by green letters
+        Requirement 3.1.2: Yellow letters: Required in the word, excluded from YELLOW positions without GREEN
+        Requirement 3.1.3: Grey letters: Exclude words containing grey letters
         
-        Args:
-            candidates: Set of candidate words to filter
+        This method applies all constraints to filter the candidate word set. Each constraint
+        is a single AND (or AND NOT) against the precomputed (position, letter) and letter
+        presence bitmaps, so no word is scanned individually. When the constraints only add
+        to those of the previous call, filtering continues from the previous result.
+        
+        Example:
+            Given constraints:
+            - Green: position 3 = 'I' (..i..)
+            - Yellow: 'S' excluded from position 1 (s....)
+            - Grey: ['A', 'N', 'T']
             
-        Returns:
-            Filtered set of candidates without grey letters
+            Input: valid_words = {'saint', 'guise', 'poise', 'noise'}
+            After filtering: candidate_words = {'guise', 'poise', 'noise'}
+            (saint excluded due to grey letters A, N, T)
         """
-        if not self.grey_constraints:
-            return candidates
-        grey_pattern = '|'.join(self.grey_constraints)
-        return {w for w in candidates if not re.search(grey_pattern, w, re.IGNORECASE)}
+        self._filter_candidates(self._constraint_key())
     
-    def _build_regex_pattern(self) -> Tuple[List[str], Set[str]]:
+    def _filter_candidates(self, constraint_key: Tuple[Tuple, Tuple, Tuple]) -> None:
         """
-        Build regex pattern for all positions based on green and yellow constraints
+        Filter candidate words for constraints whose fingerprint the caller already built
         
-        Returns:
-            Tuple of (regex_pattern_list, yellow_letters_to_include_set)
+        Args:
+            constraint_key: Result of _constraint_key() for the current constraints
         """
-        regex_pattern = [''] * self.WORD_LENGTH
-        
-        for pos, letter in self.green_constraints.items():
-            regex_pattern[pos - 1] = letter.lower()
-        
-        yellow_letters_to_include = set()
-        position_exclusions: Dict[int, Set[str]] = {}
+        if not self.valid_words:
+            self.candidate_words = set()
+            return
         
-        for letter, excluded_positions in self.yellow_constraints.items():
-            yellow_letters_to_include.add(letter.lower())
-            for pos in excluded_positions:
-                if not regex_pattern[pos - 1]:
-                    if pos not in position_exclusions:
-                        position_exclusions[pos] = set()
-                    position_exclusions[pos].add(letter.lower())
+        # Constraints only accumulate during a game, so when the previous filter's constraints
+        # are still in force, start from its result and apply just the new constraints
+        delta = self._constraint_delta(constraint_key)
+        if delta is None:
+            bits = self._narrow_bits(
+                self._all_bits, self.green_constraints, self.yellow_constraints, self.grey_constraints
+            )
+        else:
+            bits = self._narrow_bits(self._last_filter[1], *delta)
+        self._last_filter = (constraint_key, bits)
         
-        for i in range(self.WORD_LENGTH):
-            if regex_pattern[i]:
-                continue
-            excluded = position_exclusions.get(i + 1, set())
-            regex_pattern[i] = self._build_position_pattern(i + 1, None, excluded)
+        # Indexed words are sorted, so the surviving bits come back in alphabetical order
+        self._set_sorted_candidates(self._bits_to_words(bits), bits)
         
-        return regex_pattern, yellow_letters_to_include
+        if not self._candidate_view():
+            self.expand_candidates_when_empty()
     
-    def _apply_regex_filter(self, candidates: Set[str], regex_pattern: List[str]) -> Set[str]:
+    def _narrow_bits(
+        self,
+        bits: int,
+        green: Dict[int, str],
+        yellow: Dict[str, Set[int]],
+        grey: Iterable[str]
+    ) -> int:
         """
-        Apply regex pattern to filter candidates
+        Narrow a bitmap of indexed words by green, yellow and grey constraints
         
         Args:
-            candidates: Set of candidate words
-            regex_pattern: List of regex patterns for each position
+            bits: Int bitmap of words to narrow
+            green: Position (1-indexed) to letter mapping
+            yellow: Letter to excluded positions mapping
+            grey: Letters that must not appear
             
         Returns:
-            Filtered set of candidates matching the regex pattern
-        """
-        pattern = '^' + ''.join(regex_pattern) + '$'
-        return {w for w in candidates if re.match(pattern, w)}
+            Int bitmap of the words in bits that satisfy the constraints
+        """
+        position_bits = self._position_bits
+        letter_bits = self._letter_bits
+        
+        # Narrow with the required (position, letter) and letter-presence bitmaps first; like
+        # pruning a subtree, once nothing survives the remaining constraints are skipped
+        required = [position_bits[pos - 1].get(letter.lower(), 0) for pos, letter in green.items()]
+        required.extend(letter_bits.get(letter.lower(), 0) for letter in yellow)
+        # Intersect the shortest bitmaps first: an AND is never longer than its shorter operand,
+        # so every later AND works on the already narrowed width
+        required.sort(key=int.bit_length)
+        for required_bits in required:
+            bits &= required_bits
+            if not bits:
+                return 0
+        
+        if bits:
+            # Green positions are already pinned to their own letter
+            bits &= ~self._excluded_bits(grey, yellow, skip_positions=self.green_constraints)
+        return bits
     
-    def _verify_yellow_letters(self, candidates: Set[str], yellow_letters_to_include: Set[str]) -> Set[str]:
+    def _constraint_delta(
+        self,
+        constraint_key: Tuple[Tuple, Tuple, Tuple]
+    ) -> Optional[Tuple[Dict[int, str], Dict[str, Set[int]], Set[str]]]:
         """
-        Verify that candidates contain all required yellow letters
+        Get the constraints added since the previous filter_candidates call
         
         Args:
-            candidates: Set of candidate words
-            yellow_letters_to_include: Set of yellow letters that must be present
+            constraint_key: Result of _constraint_key() for the current constraints
             
         Returns:
-            Filtered set of candidates containing all required yellow letters
+            Tuple of (new green, new yellow, new grey) constraints, or None if the previous
+            filter result cannot be reused (no previous filter, or a constraint was removed
+            or changed)
         """
-        if not yellow_letters_to_include:
-            return candidates
+        if self._last_filter is None:
+            return None
+        last_green_items, last_yellow_items, last_grey_items = self._last_filter[0]
+        last_green = dict(last_green_items)
+        last_yellow = {letter: set(positions) for letter, positions in last_yellow_items}
+        last_grey = set(last_grey_items)
+        green = self.green_constraints
         
-        final_candidates = set()
-        for word in candidates:
-            word_letters = set(word.lower())
-            if yellow_letters_to_include.issubset(word_letters):
-                final_candidates.add(word)
-        return final_candidates
+        if any(green.get(pos) != letter for pos, letter in last_green.items()):
+            return None
+        if not last_grey <= self.grey_constraints:
+            return None
+        for letter, positions in last_yellow.items():
+            if not positions <= self.yellow_constraints.get(letter, set()):
+                return None
+            # An earlier exclusion at a newly green position must now be skipped, so it
+            # cannot be carried over
+            if any(pos in green and pos not in last_green for pos in positions):
+                return None
+        
+        new_green = {pos: letter for pos, letter in green.items() if pos not in last_green}
+        new_yellow = {
+            letter: positions - last_yellow.get(letter, set())
+            for letter, positions in self.yellow_constraints.items()
+            if letter not in last_yellow or positions - last_yellow[letter]
+        }
+        new_grey = self.grey_constraints - last_grey
+        return new_green, new_yellow, new_grey
     
-    def filter_candidates(self) -> None:
+    def _excluded_bits(
+        self,
+        grey: Iterable[str],
+        yellow: Dict[str, Set[int]],
+        skip_positions: Iterable[int] = ()
+    ) -> int:
         """
-        Filter candidate words using regex-based constraints
+        Fold grey and yellow exclusions into one bitmap of ruled-out indexed words
         
-        Requirement 5.1: Use regex-based filtering for efficient constraint application
-        Requirement 3.1.1: Green letters: Fixed positions specified by green letters shall be applied via regex
-        Requirement 3.1.2: Yellow letters: Included in regex for positions without GREEN, excluded from YELLOW positions
-        Requirement 3.1.3: Grey letters: Exclude words containing grey letters
-        
-        This method applies all constraints to filter the candidate word set.
-        
-        Example:
-            Given constraints:
-            - Green: position 3 = 'I' (..i..)
-            - Yellow: 'S' excluded from position 1 (s....)
-            - Grey: ['A', 'N', 'T']
+        Args:
+            grey: Letters that must not appear
+            yellow: Letter to excluded positions mapping
+            skip_positions: Positions (1-indexed) whose yellow exclusions are ignored
             
-            Input: valid_words = {'saint', 'guise', 'poise', 'noise'}
-            After filtering: candidate_words = {'guise', 'poise', 'noise'}
-            (saint excluded due to grey letters A, N, T)
+        Returns:
+            Int bitmap of words containing a grey letter, or a yellow letter at a position
+            it is excluded from
+        """
+        position_bits = self._position_bits
+        letter_bits = self._letter_bits
+        excluded = 0
+        for letter in grey:
+            excluded |= letter_bits.get(letter.lower(), 0)
+        for letter, excluded_positions in yellow.items():
+            letter = letter.lower()
+            for pos in excluded_positions:
+                if pos not in skip_positions:
+                    excluded |= position_bits[pos - 1].get(letter, 0)
+        return excluded
+    
+    def _expansion_allowed_bits(self) -> int:
         """
-        if not self.valid_words:
-            self.candidate_words = set()
-            return
+        Get the bitmap of indexed words that satisfy every grey and yellow constraint
         
-        candidates = self.valid_words.copy()
-        candidates = self._filter_grey_letters(candidates)
-        regex_pattern, yellow_letters_to_include = self._build_regex_pattern()
-        regex_candidates = self._apply_regex_filter(candidates, regex_pattern)
-        regex_candidates = self._verify_yellow_letters(regex_candidates, yellow_letters_to_include)
+        Expanded candidates are checked against these once, as a single AND, instead of
+        validating each word separately. Unlike filter_candidates, yellow exclusions apply
+        at green positions too.
         
-        self.candidate_words = regex_candidates
-        
-        if not self.candidate_words:
-            self.expand_candidates_when_empty()
+        Returns:
+            Int bitmap over indexed words
+        """
+        bits = self._all_bits
+        for letter in self.yellow_constraints:
+            bits &= self._letter_bits.get(letter.lower(), 0)
+        return bits & ~self._excluded_bits(self.grey_constraints, self.yellow_constraints)
     
-    def _validate_expanded_candidate(self, word: str) -> bool:
+    def _fixed_letter_bits(self, base_word: List[str]) -> int:
         """
-        Validate that an expanded candidate word matches all constraints
+        Get the bitmap of indexed words that have every fixed letter of a base word
         
         Args:
-            word: Word to validate (lowercase)
+            base_word: Base word pattern with fixed positions filled (lowercase) and '' elsewhere
             
         Returns:
-            True if word matches all constraints, False otherwise
+            Int bitmap over indexed words
         """
-        if any(grey_letter.lower() in word for grey_letter in self.grey_constraints):
-            return False
-        return self._word_matches_yellow_constraints(word)
+        bits = self._all_bits
+        for index, fixed_letter in enumerate(base_word):
+            if fixed_letter:
+                bits &= self._position_bits[index].get(fixed_letter, 0)
+        return bits
     
     def _expand_single_unfixed_position(
         self, 
@@ -948,14 +1407,17 @@ class WordleSolver:
             Set of valid expanded candidate words
         """
         expanded_candidates = set()
-        for letter in position_letters[unfixed_pos]:
-            candidate = base_word.copy()
-            candidate[unfixed_pos - 1] = letter
-            word = ''.join(candidate)
-            if word in self.valid_words and self._validate_expanded_candidate(word):
-                expanded_candidates.add(word)
-                if len(expanded_candidates) >= self.MAX_EXPANDED_CANDIDATES:
-                    break
+        fixed_bits = self._fixed_letter_bits(base_word) & self._expansion_allowed_bits()
+        if not fixed_bits:
+            # No word fits the fixed letters and constraints, whatever the trial letter
+            return expanded_candidates
+        letter_column = self._position_bits[unfixed_pos - 1]
+        # With every other position fixed, each distinct letter matches at most one indexed
+        # word; islice stops the lazy letter scan once MAX_EXPANDED_CANDIDATES words are found
+        letters = dict.fromkeys(position_letters[unfixed_pos])
+        letter_matches = (fixed_bits & letter_column.get(letter, 0) for letter in letters)
+        matched_words = (self._indexed_words[bits.bit_length() - 1] for bits in letter_matches if bits)
+        expanded_candidates.update(islice(matched_words, self.MAX_EXPANDED_CANDIDATES))
         return expanded_candidates
     
     def _expand_multiple_unfixed_positions(
@@ -980,22 +1442,46 @@ class WordleSolver:
             return expanded_candidates
         
         pos = unfixed_positions[0]
+        
+        # Words matching the fixed letters and every grey/yellow constraint come straight from
+        # the bitmaps, so no word has to be matched or validated individually
+        fixed_bits = self._fixed_letter_bits(base_word) & self._expansion_allowed_bits()
+        if not fixed_bits:
+            # No word fits the fixed letters and constraints, whatever the trial letters
+            return expanded_candidates
+        letter_column = self._position_bits[pos - 1]
+        
+        # Gather every match for the top letters at the first unfixed position, then keep the
+        # MAX_EXPANDED_CANDIDATES best by joint positional frequency rather than the first found
+        letter_bits = 0
         for letter in position_letters[pos][:self.MAX_LETTERS_PER_POSITION_FOR_EXPANSION]:
-            candidate = base_word.copy()
-            candidate[pos - 1] = letter
-            partial_word = ''.join(c if c else '.' for c in candidate)
-            pattern = '^' + partial_word.replace('.', '[a-z]') + '$'
-            
-            for word in self.valid_words:
-                if re.match(pattern, word) and self._validate_expanded_candidate(word):
-                    expanded_candidates.add(word)
-                    if len(expanded_candidates) >= self.MAX_EXPANDED_CANDIDATES:
-                        break
-            if len(expanded_candidates) >= self.MAX_EXPANDED_CANDIDATES:
-                break
+            letter_bits |= letter_column.get(letter, 0)
+        matches = self._bits_to_words(fixed_bits & letter_bits)
+        rank_tables = [(unfixed - 1, self._letter_ranks[unfixed]) for unfixed in unfixed_positions]
+        best = heapq.nsmallest(
+            self.MAX_EXPANDED_CANDIDATES,
+            self._score_words(matches, rank_tables),
+            # Matches are decoded in alphabetical order and nsmallest keeps ties in input order
+            key=itemgetter(1)
+        )
+        expanded_candidates.update(word for word, _ in best)
         
         return expanded_candidates
     
+    def _expansion_letters(self, position: int, grey_lower: FrozenSet[str]) -> List[str]:
+        """
+        Get the frequency-ordered letters for a position, minus grey letters
+        
+        Args:
+            position: Position number (1-5)
+            grey_lower: Grey letters, lowercase
+            
+        Returns:
+            Letters from the position's frequency file that are not grey
+        """
+        # The parsed frequency order is already held per position; only the grey filter varies
+        return [l for l in self.positional_frequencies.get(position, []) if l not in grey_lower]
+    
     def expand_candidates_when_empty(self) -> None:
         """
         Iteratively expand top-N letter set when candidate set becomes empty
@@ -1033,11 +1519,8 @@ class WordleSolver:
             for pos, letter in self.green_constraints.items():
                 base_word[pos - 1] = letter.lower()
             
-            position_letters: Dict[int, List[str]] = {}
-            for pos in unfixed_positions:
-                letters = self.extract_top_letters(pos, n=self.MAX_LETTERS_IN_ALPHABET)
-                filtered_letters = [l for l in letters if l.upper() not in self.grey_constraints]
-                position_letters[pos] = filtered_letters
+            grey_lower = frozenset(grey_letter.lower() for grey_letter in self.grey_constraints)
+            position_letters = {pos: self._expansion_letters(pos, grey_lower) for pos in unfixed_positions}
             if len(unfixed_positions) == 1:
                 expanded_candidates = self._expand_single_unfixed_position(
                     base_word, unfixed_positions[0], position_letters